@@ -0,0 +1,9 @@
+import functools
+
+from dotenv import dotenv_values
+
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    # le o .env uma unica vez por processo
+    return dotenv_values(".env")
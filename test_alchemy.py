@@ -6,11 +6,16 @@ from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column, relationship
 from sqlalchemy.orm import Session
 
-from dotenv import dotenv_values, set_key
+from dotenv import set_key
 
 from typing import Optional, List
 
-CONFIG = dotenv_values(".env")  # CONFIG = {"USER": "foo", "EMAIL": "foo@example.org"}
+import sys
+
+from config import get_config
+
+CONFIG = get_config()  # CONFIG = {"USER": "foo", "EMAIL": "foo@example.org"}
+_S = CONFIG['POSTGRES_SCHEMA']
 
     # declarative base class
 class Base(DeclarativeBase):
@@ -18,9 +23,9 @@ class Base(DeclarativeBase):
 
 class EmpregadoProjeto(Base):
     __tablename__ = "Empregado_Projeto"
-    __table_args__ = {"schema": CONFIG['POSTGRES_SCHEMA']}
-    empregado_id: Mapped[int] = mapped_column(ForeignKey(f"{CONFIG['POSTGRES_SCHEMA']}.Empregado.id"), primary_key=True) # {CONFIG['POSTGRES_SCHEMA']}.Empregado.id (schema.table.column)
-    projeto_id: Mapped[int] = mapped_column(BigInteger, ForeignKey(f"{CONFIG['POSTGRES_SCHEMA']}.Projeto.id"), primary_key=True) # {CONFIG['POSTGRES_SCHEMA']}.Projeto.id (schema.table.column)
+    __table_args__ = {"schema": _S}
+    empregado_id: Mapped[int] = mapped_column(ForeignKey(f"{_S}.Empregado.id"), primary_key=True) # {CONFIG['POSTGRES_SCHEMA']}.Empregado.id (schema.table.column)
+    projeto_id: Mapped[int] = mapped_column(BigInteger, ForeignKey(f"{_S}.Projeto.id"), primary_key=True) # {CONFIG['POSTGRES_SCHEMA']}.Projeto.id (schema.table.column)
     obsevacao: Mapped[Optional[str]]
     projeto: Mapped["Projeto"] = relationship(back_populates="empregados")
     empregado: Mapped["Empregado"] = relationship(back_populates="projetos")
@@ -28,14 +33,14 @@ class EmpregadoProjeto(Base):
 # an example mapping using the base
 class Empregado(Base):
     __tablename__ = "Empregado"
-    __table_args__ = {"schema": CONFIG['POSTGRES_SCHEMA']}
+    __table_args__ = {"schema": _S}
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(30))
     projetos: Mapped[List["EmpregadoProjeto"]] = relationship(back_populates="empregado")
 
 class Projeto(Base):
     __tablename__ = "Projeto"
-    __table_args__ = {"schema": CONFIG['POSTGRES_SCHEMA']}
+    __table_args__ = {"schema": _S}
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     name: Mapped[str] = mapped_column(String(30))
     empregados: Mapped[List["EmpregadoProjeto"]] = relationship(back_populates="projeto")
@@ -50,7 +55,18 @@ def init_engine():
         database="postgres"
     )
     
-    engine = create_engine(url)
+    # se houver um pooler (PgBouncer etc.) configurado no .env, conecta por ele
+    if CONFIG.get('POSTGRES_POOLER_URL'):
+        url = CONFIG['POSTGRES_POOLER_URL']
+
+    engine = create_engine(
+        url,
+        query_cache_size=1200,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=300,
+        pool_pre_ping=True
+    )
 
 
 
@@ -88,16 +104,17 @@ if __name__ == '__main__':
         emp = gen_empregado('jose', 'alpha', 'secreto')
         session.add(emp)
         # res = session.query(Projeto).filter(Projeto.name=='projeto A')
-        res = session.query(Projeto)
-        res2= session.query(exists().where(Projeto.name=='alpha'))
-        print(res.statement)
-        print(res2.statement)
-        for r in res:
-            print(f'\n{r.id} - {r.name}')
+        stmt = select(Projeto.id, Projeto.name).execution_options(yield_per=100) # busca em lotes via cursor no servidor
+        stmt2 = select(exists().where(Projeto.name=='alpha'))
+        print(stmt)
+        print(stmt2)
+        for lote in session.execute(stmt).partitions():
+            sys.stdout.write(''.join(f'\n{r.id} - {r.name}\n' for r in lote)) # uma escrita por lote
         
-        print(res2.scalar())
+        existe_alpha = session.execute(stmt2).scalar() # uma unica ida ao banco
+        print(existe_alpha)
 
-        print('existe') if res2.scalar() else print('nao existe!!!!')        #stmt = select(User).where(User.name.in_(["spongebob", "sandy"]))
+        print('existe' if existe_alpha else 'nao existe!!!!')        #stmt = select(User).where(User.name.in_(["spongebob", "sandy"]))
 
         session.commit()
     pass